@@ -46,10 +46,28 @@ something = registry['something_i_need']
 
 __version__ = "1.5.0"
 
+from typing import TYPE_CHECKING, Any
+
 from . import inject
-from .inject_attrs import inject_define as define, inject_field as field
 from .registry import Registry, initialize
 
+if TYPE_CHECKING:
+    from .inject_attrs import inject_define as define, inject_field as field
+
+
+def __getattr__(name: str) -> Any:
+    # Lazily import the attrs integration (PEP 562) so that users of the
+    # plain decorator API do not pay for importing attrs machinery.
+    if name == "define":
+        from .inject_attrs import inject_define
+
+        return inject_define
+    if name == "field":
+        from .inject_attrs import inject_field
+
+        return inject_field
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "define",
     "field",
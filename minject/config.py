@@ -19,6 +19,13 @@ class RegistryConfigWrapper:
 
     def __init__(self):
         self._impl = {}
+        # Bound method of the underlying mapping, rebound in from_dict. Saves
+        # the _impl attribute and method lookups on every config access.
+        self._get = self._impl.get
+        # The "registry" section holds the registry's own settings (such as
+        # autostart). It is static after from_dict, so flatten the nested
+        # lookup once instead of re-walking it on every access.
+        self._registry_section: Mapping[str, Any] = {}
 
     def from_dict(self, config_dict: Mapping[str, Any]):
         """Configure the registry from a dictionary-like mapping.
@@ -33,15 +40,19 @@ class RegistryConfigWrapper:
             config_dict: the configuration data to apply.
         """
         self._impl = config_dict
+        self._get = config_dict.get
+        self._registry_section = config_dict.get("registry") or {}
 
     def __contains__(self, key: str):
         return key in self._impl
 
     def get(self, key: str, default: Optional[T] = None) -> T:
-        return self._impl.get(key, default)
+        return self._get(key, default)
 
     def __getitem__(self, key: str) -> Any:
-        item: Optional[Any] = self.get(key)
+        # Look up directly in the underlying mapping rather than going through
+        # self.get, which saves a method call on the config resolution path.
+        item: Optional[Any] = self._get(key)
         if item is None:
             raise KeyError(key)
         return item
@@ -1,7 +1,9 @@
 """Collection of annotations to define how a class should be initialized by the registry."""
 
-import itertools
+import functools
 import os
+import sys
+import weakref
 from asyncio import to_thread
 from typing import (
     Any,
@@ -12,13 +14,10 @@ from typing import (
     Type,
     TypeVar,
     Union,
-    cast,
     overload,
 )
 
-from typing_extensions import TypeGuard, assert_type
-
-from minject.types import _AsyncContext
+from typing_extensions import TypeGuard
 
 from .metadata import _INJECT_METADATA_ATTR, RegistryMetadata, _gen_meta, _get_meta
 from .model import (
@@ -27,8 +26,9 @@ from .model import (
     RegistryKey,  # pylint: disable=unused-import
     Resolver,
     resolve_value,
+    self_tag,
 )
-from .types import _AsyncContext, _MinimalMappingProtocol
+from .types import _AsyncContext
 
 T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
@@ -42,6 +42,8 @@ class _RaiseKeyError:
     DO NOT instantiate this class directly, instead use the `RAISE_KEY_ERROR` singleton.
     """
 
+    __slots__ = ()
+
     def __nonzero__(self):
         return False
 
@@ -192,7 +194,9 @@ def define(
 
 def _is_type(key: "RegistryKey[T]") -> TypeGuard[Type[T]]:
     """A typeguard function to see if a RegistryKey[T] is-a Type[T]"""
-    return isinstance(key, type)
+    # plain classes are the common case; the pointer compare short-circuits
+    # before the MRO-walking isinstance (which still covers metaclasses)
+    return type(key) is type or isinstance(key, type)
 
 
 def _is_key_async(key: "RegistryKey[T]") -> bool:
@@ -211,47 +215,93 @@ def _is_key_async(key: "RegistryKey[T]") -> bool:
     elif isinstance(key, RegistryMetadata):
         return key.is_async_context
     else:
-        assert_type(key, Type[T])
+        # key has been narrowed to Type[T] by the branches above
         inject_metadata = _get_meta(key)
         if inject_metadata is None:
             return False
         return inject_metadata.is_async_context
 
 
+def _referenced_type_from_meta(key: "RegistryMetadata[T]") -> "Type[T]":
+    try:
+        return key.interfaces[0]
+    except IndexError:
+        raise TypeError("Unable to fetch type of key, no interface.")
+
+
+def _referenced_type_from_type(key: "Type[T]") -> "Type[T]":
+    return key
+
+
+def _referenced_type_from_str(key: str) -> "Type":
+    raise TypeError(
+        "The Key is a string. No object is being referenced from within the key itself."
+    )
+
+
+def _referenced_type_from_other(key: Any) -> "Type":
+    raise TypeError("The Key is neither a string, type, or RegistryMetadata")
+
+
+# dispatch on the exact key type, replacing a chain of type comparisons
+_REFERENCED_TYPE_HANDLERS: Dict[type, Callable[[Any], type]] = {
+    RegistryMetadata: _referenced_type_from_meta,
+    type: _referenced_type_from_type,
+    str: _referenced_type_from_str,
+}
+
+
 class _RegistryReference(Deferred[T_co]):
     """Reference to an object in the registry to be loaded later.
     (you should not instantiate this class directly, instead use the
     inject.reference function)
     """
 
+    # __weakref__ keeps instances usable as WeakValueDictionary values
+    __slots__ = ("_key", "_target", "_is_async", "_str", "_repr", "__weakref__")
+
     def __init__(self, key: "RegistryKey[T_co]") -> None:
-        self._key = key
+        # intern string keys so name-based registry lookups compare by
+        # identity in the common case
+        self._key = sys.intern(key) if type(key) is str else key
+        # When the referenced class already carries its own metadata at
+        # reference creation time, resolve through that metadata directly so
+        # the registry skips the class-to-metadata mapping on every lookup.
+        # Classes without their own metadata keep the class key, which also
+        # preserves the registry's concrete-subtype fallback for them.
+        self._target: "RegistryKey[T_co]" = self._key
+        # _is_type holds the pointer-compare fast path and, as a TypeGuard,
+        # keeps the key narrowed to a class for mypy
+        if _is_type(key):
+            meta = _get_meta(key, include_bases=False)
+            if meta is not None:
+                self._target = meta
+        # async-ness of the target, classified lazily on first aresolve
+        # (by which point all decorators have been applied)
+        self._is_async: Optional[bool] = None
+        # keys are immutable, so format the debug strings once up front
+        # rather than on every __str__/__repr__ call
+        if _is_type(key):
+            self._str = f"ref({key.__name__})"
+        else:
+            self._str = f"ref({key})"
+        self._repr = f"<_RegistryReference({key!r})>"
 
     def resolve(self, registry_impl: Resolver) -> T_co:
-        return registry_impl.resolve(self._key)
+        return registry_impl.resolve(self._target)
 
     async def aresolve(self, registry_impl: Resolver) -> T_co:
-        if _is_key_async(self._key):
-            return await registry_impl._aresolve(self._key)
-        return await to_thread(registry_impl.resolve, self._key)
+        is_async = self._is_async
+        if is_async is None:
+            is_async = self._is_async = _is_key_async(self._target)
+        if is_async:
+            return await registry_impl._aresolve(self._target)
+        return await to_thread(registry_impl.resolve, self._target)
 
     @property
     def type_of_object_referenced_in_key(self) -> "Type[T_co]":
-        if type(self.key) == RegistryMetadata:
-            try:
-                return self.key.interfaces[0]
-            except IndexError:
-                raise TypeError("Unable to fetch type of key, no interface.")
-        elif type(self.key) == type:
-            return self.key
-
-        elif type(self.key) == str:
-            raise TypeError(
-                "The Key is a string. No object is being referenced from within the key itself."
-            )
-
-        else:
-            raise TypeError("The Key is neither a string, type, or RegistryMetadata")
+        handler = _REFERENCED_TYPE_HANDLERS.get(type(self._key), _referenced_type_from_other)
+        return handler(self._key)
 
     @property
     def key(self) -> "RegistryKey[T_co]":
@@ -262,13 +312,19 @@ class _RegistryReference(Deferred[T_co]):
         return self._key
 
     def __str__(self) -> str:
-        if _is_type(self._key):
-            return f"ref({self._key.__name__})"
-        else:
-            return f"ref({self._key})"
+        return self._str
 
     def __repr__(self) -> str:
-        return f"<_RegistryReference({self._key!r})>"
+        return self._repr
+
+
+# Cache of references without bindings. References are immutable, so
+# repeated inject.reference(key) calls across a binding graph can share a
+# single instance per key. Entries are dropped once nothing else holds the
+# reference.
+_bare_reference_cache: "weakref.WeakValueDictionary[Any, _RegistryReference]" = (
+    weakref.WeakValueDictionary()
+)
 
 
 @overload
@@ -286,8 +342,16 @@ def reference(key: Type[T], **bindings: DeferredAny) -> _RegistryReference[T]: .
 def reference(key, **bindings):
     """Return a reference to another registry key."""
     if not bindings:
-        return _RegistryReference(key)
-    elif isinstance(key, type):
+        try:
+            ref = _bare_reference_cache.get(key)
+        except TypeError:
+            # unhashable key; hand out an uncached reference
+            return _RegistryReference(key)
+        if ref is None:
+            ref = _RegistryReference(key)
+            _bare_reference_cache[key] = ref
+        return ref
+    elif type(key) is type or isinstance(key, type):
         return _RegistryReference(define(key, None, None, None, **bindings))
     else:
         raise TypeError("inject.reference can only include bindings on classes")
@@ -296,6 +360,9 @@ def reference(key, **bindings):
 class _RegistryFunction(Deferred[T_co]):
     """Function to call to resolve an initialization argument."""
 
+    # __weakref__ keeps instances usable as WeakValueDictionary values
+    __slots__ = ("_func", "_args", "_kwargs", "_cached_str", "__weakref__")
+
     def __init__(
         self,
         func: Callable[..., T_co],
@@ -305,17 +372,21 @@ class _RegistryFunction(Deferred[T_co]):
         **kwargs: DeferredAny,
     ):
         self._func = func
-        self._args = args or ()
-        self._kwargs = kwargs or {}
+        self._args = args
+        self._kwargs = kwargs
+        # debug string, formatted at most once on first __str__ call
+        self._cached_str: Optional[str] = None
 
     def resolve(self, registry_impl: Resolver) -> T_co:
-        args = []
-        for arg in self.args:
-            args.append(resolve_value(registry_impl, arg))
-        kwargs = {}
-        for key, arg in self.kwargs.items():
-            kwargs[key] = resolve_value(registry_impl, arg)
-        return self.func()(*args, **kwargs)
+        # read the slots directly; the property/method indirection is
+        # measurable when a function binding fires per constructed object
+        _resolve = resolve_value
+        args = [_resolve(registry_impl, arg) for arg in self._args]
+        if not self._kwargs:
+            # common shape (function(func, *args)); skip the kwargs dict
+            return self._func(*args)
+        kwargs = {key: _resolve(registry_impl, arg) for key, arg in self._kwargs.items()}
+        return self._func(*args, **kwargs)
 
     async def aresolve(self, registry_impl: Resolver) -> T_co:
         raise NotImplementedError("Have not implemented async registry function")
@@ -335,20 +406,26 @@ class _RegistryFunction(Deferred[T_co]):
         return self.resolve(registry_impl)
 
     def __str__(self) -> str:
-        return "{}({})".format(
-            self._func if isinstance(self._func, str) else self._func.__name__,
-            ", ".join(
-                itertools.chain(
-                    (str(arg) for arg in self._args),
-                    ("{}={}".format(*item) for item in self._kwargs.items()),
-                )
-            ),
-        )
+        # func/args/kwargs never change after construction, so format once
+        # and reuse the string on subsequent calls
+        if self._cached_str is None:
+            name = self._func if isinstance(self._func, str) else self._func.__name__
+            parts = [str(arg) for arg in self._args]
+            parts.extend(f"{key}={value}" for key, value in self._kwargs.items())
+            self._cached_str = f"{name}({', '.join(parts)})"
+        return self._cached_str
 
     def __repr__(self) -> str:
         return f"<_RegistryFunction({self._func!r}(args={self._args!r}, kwargs={self._kwargs!r}))>"
 
 
+# Cache of function bindings keyed by their full declaration. Entries are
+# dropped once nothing else holds the binding.
+_function_cache: "weakref.WeakValueDictionary[Any, _RegistryFunction]" = (
+    weakref.WeakValueDictionary()
+)
+
+
 def function(
     func: Callable[..., T], *args: DeferredAny, **kwargs: DeferredAny
 ) -> _RegistryFunction[T]:
@@ -367,46 +444,64 @@ def function(
                 "positional argument to call getattr on"
             )
 
-    return _RegistryFunction(func, *args, **kwargs)
-
-
-def _is_key_error(obj: Any) -> TypeGuard[_RaiseKeyError]:
-    return obj is RAISE_KEY_ERROR
+    # function bindings are immutable once built, so identical declarations
+    # can share one instance; unhashable arguments fall back to a fresh one
+    cache_key = (func, args, tuple(kwargs.items()))
+    try:
+        fn = _function_cache.get(cache_key)
+    except TypeError:
+        return _RegistryFunction(func, *args, **kwargs)
+    if fn is None:
+        fn = _RegistryFunction(func, *args, **kwargs)
+        _function_cache[cache_key] = fn
+    return fn
 
 
 class _RegistryConfig(Deferred[T_co]):
     """Reference to a value in the configuration object."""
 
+    __slots__ = ("_key", "_default", "_fallback_to_envvar")
+
     def __init__(
         self,
         key: Optional[str],
         default: Union[T_co, _RaiseKeyError] = RAISE_KEY_ERROR,
         fallback_to_envvar: bool = False,
     ) -> None:
-        self._key = key
+        # interned keys let dict lookups against the config mapping (and
+        # os.environ) hit CPython's identity fast path
+        # callers occasionally pass non-string keys, so only intern str
+        self._key = sys.intern(key) if type(key) is str else key
         self._default = default
         self._fallback_to_envvar = fallback_to_envvar
 
     def resolve(self, registry_impl: Resolver) -> T_co:
-        if self._key is None:
-            return cast(
-                T_co, registry_impl.config
-            )  # If _key is None then T is RegistryConfigWrapper
-        if self._key in registry_impl.config:
-            # first try to resolve the key from the config mapping
-            return registry_impl.config[self._key]
-        if self._fallback_to_envvar and self._key in os.environ:
+        # typing.cast is a real function call at runtime, so the returns
+        # below use type-ignores instead to keep this path call-free
+        # whole-config references resolve via _RegistryWholeConfig, so named
+        # references always carry a key; the assert narrows it for mypy
+        key = self._key
+        assert key is not None
+        # first try to resolve the key from the config mapping; a single
+        # probe, relying on the wrapper's None-means-missing convention
+        value: Optional[Any] = registry_impl.config.get(key)
+        if value is not None:
+            return value
+        if self._fallback_to_envvar:
             # then, if allowed, try to fallback to an environment variable
-            return cast(T_co, os.environ[self._key])
+            env_value = os.environ.get(key)
+            if env_value is not None:
+                return env_value  # type: ignore[return-value]
 
         # finally fallback to default (which may be to raise a key error)
-        if _is_key_error(self._default):
-            raise KeyError(self._key)
+        if self._default is RAISE_KEY_ERROR:
+            raise KeyError(key)
         else:
-            return cast(T_co, self._default)
+            return self._default  # type: ignore[return-value]
 
     async def aresolve(self, registry_impl: Resolver) -> T_co:
-        return await to_thread(self.resolve, registry_impl)
+        # config reads are plain dict lookups; no need for a thread hop
+        return self.resolve(registry_impl)
 
     @property
     def key(self) -> Optional[str]:
@@ -423,7 +518,33 @@ class _RegistryConfig(Deferred[T_co]):
         return f"<_RegistryConfig({self._key!r})>"
 
 
+class _RegistryWholeConfig(_RegistryConfig[T_co]):
+    """Reference to the configuration object itself (a config() with no name).
+
+    Splitting this case into a subclass keeps the `_key is None` check out of
+    the per-resolve path of named config references.
+    """
+
+    __slots__ = ()
+
+    def resolve(self, registry_impl: Resolver) -> T_co:
+        # If _key is None then T is RegistryConfigWrapper
+        return registry_impl.config  # type: ignore[return-value]
+
+    async def aresolve(self, registry_impl: Resolver) -> T_co:
+        return registry_impl.config  # type: ignore[return-value]
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_dotted(keys: str) -> Sequence[str]:
+    """Split a dotted config name into its parts, sharing the result across
+    repeat uses of the same literal (common in large binding graphs)."""
+    return tuple(sys.intern(part) for part in keys.split("."))
+
+
 class _RegistryNestedConfig(Deferred[T_co]):
+    __slots__ = ("_keys", "_default")
+
     def __init__(
         self,
         keys: Union[Sequence[str], str],
@@ -437,22 +558,30 @@ class _RegistryNestedConfig(Deferred[T_co]):
         See Also:
             The `nested_config` method's documentation for more information on parameters, etc.
         """
-        self._keys: Sequence[str] = keys.split(".") if isinstance(keys, str) else keys
+        self._keys: Sequence[str] = _split_dotted(keys) if isinstance(keys, str) else keys
         self._default = default
 
     def resolve(self, registry_impl: Resolver) -> T_co:
-        sub = registry_impl.config
+        # isinstance against a runtime-checkable protocol does attribute
+        # introspection per call; probe each level directly instead and
+        # treat a TypeError (level does not support containment) the same
+        # as a missing key.
+        sub: Any = registry_impl.config
         for key in self._keys:
-            if isinstance(sub, _MinimalMappingProtocol) and key in sub:
-                sub = sub[key]
-            elif isinstance(self._default, _RaiseKeyError):
+            try:
+                if key in sub:
+                    sub = sub[key]
+                    continue
+            except TypeError:
+                pass
+            if self._default is RAISE_KEY_ERROR:
                 raise KeyError(self._keys)
-            else:
-                return self._default
-        return cast(T_co, sub)
+            return self._default  # type: ignore[return-value]
+        return sub  # type: ignore[return-value]
 
     async def aresolve(self, registry_impl: Resolver) -> T_co:
-        return await to_thread(self.resolve, registry_impl)
+        # nested config reads are plain mapping walks; no need for a thread hop
+        return self.resolve(registry_impl)
 
 
 def nested_config(
@@ -504,20 +633,13 @@ def config(
     Raises:
         KeyError: The given name is not found and no default is provided (RAISE_KEY_ERROR)
     """
+    if name_ is None:
+        return _RegistryWholeConfig(name_, default, fallback_to_envvar)
     return _RegistryConfig(name_, default, fallback_to_envvar)
 
 
-class _RegistrySelf(Deferred[Resolver]):
-    """Reference to the Registry instance itself."""
-
-    def resolve(self, registry_impl: Resolver) -> Resolver:
-        return registry_impl
-
-    async def aresolve(self, registry_impl: Resolver) -> Resolver:
-        return await to_thread(self.resolve, registry_impl)
-
-
-self_tag = _RegistrySelf()
+# self_tag lives in .model (next to resolve_value, which special-cases it)
+# and is re-exported here, where users have always imported it from.
 
 # we must export this from minject to provide backwards
 # compatability to a legacy system
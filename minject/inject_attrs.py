@@ -1,174 +1,197 @@
+import functools
 import inspect
+import linecache
+import sys
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import Any, DefaultDict, Dict, List, Optional, Type, TypeVar
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple, Type, TypeVar
 
 from attr import define, field
-from packaging import version
 
 from minject import inject
 
 _T = TypeVar("_T")
 _P = TypeVar("_P")
 
-_INJECT_DEFINE_DEFINE_KWARGS_DEFAULT_VAL: Dict[str, Any] = {}
+_VersionTuple = Tuple[int, ...]
 
 
-class _AttrDefineKwarg:
+def _version_tuple(version_string: str) -> _VersionTuple:
     """
-    Class to hold kwargs for attr.define. Includes what version
-    a value was added as a paramter to attr.define. This is used
-    to disable features not tied to generating __init__ methods.
+    Parse the leading numeric components of a version string into a tuple
+    for ordering comparisons. attrs releases use plain X.Y.Z versions, so
+    this covers everything the gating below needs without pulling in a
+    full version parser; any non-numeric suffix (e.g. a dev build) is
+    ignored.
     """
-
-    def __init__(
-        self,
-        key_word: str,
-        attr_version_start: str,
-        attr_verson_end: Optional[str] = None,
-        value: bool = False,
-    ) -> None:
-        self.key_word: str = key_word
-        self.attr_version_start: str = attr_version_start
-        self.attr_version_end: Optional[str] = attr_verson_end
-        self.value: bool = value
-
-
-# this list disables more settings that are enabled
-# by default in an attempt to disable settings that were previously
-# enabled by default but no longer are, like eq.
-_ATTRS_DEFINE_DISABLE_EVERYTHING_BUT_INIT: List[_AttrDefineKwarg] = [
-    _AttrDefineKwarg("init", "0.0.0", value=True),
-    _AttrDefineKwarg("repr", "0.0.0"),
-    _AttrDefineKwarg("hash", "0.0.0"),
-    _AttrDefineKwarg("str", "0.0.0"),
-    _AttrDefineKwarg("slots", "16.0.0"),
-    _AttrDefineKwarg("frozen", "16.1.0"),
-    _AttrDefineKwarg("weakref_slot", "18.2.0"),
-    _AttrDefineKwarg("auto_exc", "19.1.0"),
-    _AttrDefineKwarg("eq", "19.2.0"),
-    _AttrDefineKwarg("order", "19.2.0"),
-    _AttrDefineKwarg("cmp", "19.2.0", "21.1.0"),
-    _AttrDefineKwarg("auto_detect", "20.1.0"),
-    _AttrDefineKwarg("match_args", "21.3.0"),
+    parts = []
+    for part in version_string.split("."):
+        if not part.isdigit():
+            break
+        parts.append(int(part))
+    return tuple(parts)
+
+
+# Table of kwargs for attr.define, as (keyword, version added, version
+# removed or None, value) tuples with the version bounds as int tuples.
+# This is used to disable features not tied to generating __init__ methods,
+# in an attempt to disable settings that were previously enabled by default
+# but no longer are, like eq.
+_ATTRS_DEFINE_DISABLE_EVERYTHING_BUT_INIT: List[
+    Tuple[str, _VersionTuple, Optional[_VersionTuple], bool]
+] = [
+    ("init", (0, 0, 0), None, True),
+    ("repr", (0, 0, 0), None, False),
+    ("hash", (0, 0, 0), None, False),
+    ("str", (0, 0, 0), None, False),
+    ("slots", (16, 0, 0), None, False),
+    ("frozen", (16, 1, 0), None, False),
+    ("weakref_slot", (18, 2, 0), None, False),
+    ("auto_exc", (19, 1, 0), None, False),
+    ("eq", (19, 2, 0), None, False),
+    ("order", (19, 2, 0), None, False),
+    ("cmp", (19, 2, 0), (21, 1, 0), False),
+    ("auto_detect", (20, 1, 0), None, False),
+    ("match_args", (21, 3, 0), None, False),
 ]
 
 
+@functools.cache
 def _get_compatible_attrs_define_kwargs() -> Dict[str, bool]:
     """
-    get kwargs compatible with current running version of attrs
+    get kwargs compatible with current running version of attrs.
+    The installed attrs version cannot change within a process, so the
+    result is computed once and shared (callers must not mutate it).
+    importlib.metadata is imported here rather than at module level so
+    that processes which never call inject_define do not pay for it.
     """
     from importlib.metadata import version as importlib_version
 
-    attr_version = importlib_version("attrs")
-
-    parsed_attr_version = version.parse(attr_version)
+    attr_version = _version_tuple(importlib_version("attrs"))
     attrs_define_kwargs: Dict[str, bool] = {}
-    for kwarg in _ATTRS_DEFINE_DISABLE_EVERYTHING_BUT_INIT:
-        if version.parse(kwarg.attr_version_start) > parsed_attr_version:
+    for keyword, version_start, version_end, value in _ATTRS_DEFINE_DISABLE_EVERYTHING_BUT_INIT:
+        if version_start > attr_version:
             continue
-        if (
-            kwarg.attr_version_end is not None
-            and version.parse(kwarg.attr_version_end) < parsed_attr_version
-        ):
+        if version_end is not None and version_end < attr_version:
             continue
-        attrs_define_kwargs[kwarg.key_word] = kwarg.value
+        attrs_define_kwargs[keyword] = value
     return attrs_define_kwargs
 
 
-@dataclass(frozen=True)
-class _BindingKey:
-    __slots__ = ("filename", "class_lineno")
-    filename: str
-    class_lineno: int  # The line containing the "class" keyword.
-
+# A binding key is a (filename, class_lineno) pair, where the line number is
+# the one containing the "class" keyword. Plain tuples are used because they
+# hash and compare at C level, unlike a dataclass wrapper.
+_BindingKey = Tuple[str, int]
 
 _key_binding_mapping: DefaultDict[_BindingKey, dict] = defaultdict(dict)
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_field_name(filename: str, lineno: int) -> str:
+    """
+    Parse the assigned-to name out of the source line at the given location.
+    Purely a function of the source on disk, so results are memoized per
+    location (module reloads re-run decoration against the same lines).
+    """
+    code = linecache.getline(filename, lineno).strip()
+    if not code:
+        return ""
+    # partition avoids the 2-element list allocations of split(maxsplit=1)
+    name_and_type, _, _ = code.partition("=")
+    name, _, _ = name_and_type.partition(":")
+    return name.strip()
+
+
 def inject_field(binding=_T, **attr_field_kwargs) -> Any:
     """
     Wrapper around attr.field which takes an argument to specify registry
     bindings
     """
-    stack = inspect.stack()
-    # The first frame of the stack is the call to inject_field itself.
+    # inspect.stack() materializes FrameInfo objects (with source context)
+    # for every frame on the stack; we only need the two calling frames, so
+    # grab them directly and read the single source line each from linecache.
 
     # We assume that inject_field is called directly (not via some kind of
-    # wrapper), so the second frame of the stack should be the field
-    # declaration. Extract the name of the field.
-    field_frame = stack[1]
-    name = ""
-    if field_frame.code_context:
-        code = field_frame.code_context[0].strip()
-        name_and_type = code.split("=", maxsplit=1)[0].rstrip().lstrip()
-        name = name_and_type.split(":", maxsplit=1)[0].rstrip().lstrip()
+    # wrapper), so the calling frame should be the field declaration.
+    # Extract the name of the field.
+    field_frame = sys._getframe(1)
+    name = _parse_field_name(field_frame.f_code.co_filename, field_frame.f_lineno)
     if not name:
         raise ValueError(
             "Could not find the variable to which the binding is assigned. Are you calling inject_field properly?"
         )
 
-    # The third frame of the stack should be the class declaration (containing
+    # The frame above that should be the class declaration (containing
     # the "class" keyword). We use that line number as the key for looking up
     # bindings, so double-check that that assumption holds.
     # (If not, our inferred field name is probably wrong too!)
-    class_frame = stack[2]
-    class_lineno = _class_lineno_from_context(class_frame.code_context, class_frame.lineno)
+    class_frame = sys._getframe(2)
+    class_filename = class_frame.f_code.co_filename
+    class_line = linecache.getline(class_filename, class_frame.f_lineno)
+    class_lineno = _class_lineno_from_context(
+        [class_line] if class_line else None, class_frame.f_lineno
+    )
     if class_lineno is None:
         raise ValueError(
             "Could not find the line containing the class declaration. Are you calling inject_field properly?"
         )
 
-    key = _BindingKey(
-        filename=class_frame.filename,
-        class_lineno=class_lineno,
-    )
+    key = (class_filename, class_lineno)
     _key_binding_mapping[key][name] = binding
     return field(**attr_field_kwargs)
 
 
 def inject_define(
     maybe_cls: Optional[Type[_T]] = None,
-    define_kwargs: Dict[str, Any] = _INJECT_DEFINE_DEFINE_KWARGS_DEFAULT_VAL,
+    define_kwargs: Optional[Dict[str, Any]] = None,
 ):
     # use default attrs kwargs or user supplied attrs kwargs
-    attrs_kwargs: Dict[str, Any] = {}
-    if define_kwargs is not _INJECT_DEFINE_DEFINE_KWARGS_DEFAULT_VAL:
-        attrs_kwargs = define_kwargs
-    else:
-        attrs_kwargs = _get_compatible_attrs_define_kwargs()
+    attrs_kwargs: Dict[str, Any] = (
+        define_kwargs if define_kwargs is not None else _get_compatible_attrs_define_kwargs()
+    )
 
     def inject_define_inner(cls: Type[_P]) -> Type[_P]:
-        # Identify the line containing the "class" keyword for cls: that is
-        # the line number that we used in the binding key for its fields.
+        # Classes with no inject_field members (no pending binding entry in
+        # this class's file) skip the line-number work entirely; scanning the
+        # source for the "class" keyword is the expensive part of decoration.
+        # The inspect calls read the file through linecache, which caches
+        # contents per module, so the residual cost here is the scan; a
+        # per-class memo of these results would pin every decorated class
+        # (and its source lines) for the life of the process.
         filename = inspect.getsourcefile(cls)
-        class_lineno = _class_lineno_from_context(*inspect.getsourcelines(cls))
-        if filename is None or class_lineno is None:
-            raise ValueError(
-                "Could not find line containing class declaration. Are you calling inject_define properly?"
-            )
-
-        # get bindings to apply to the class
-        key = _BindingKey(
-            filename=filename,
-            class_lineno=class_lineno,
-        )
-        bindings = _key_binding_mapping.get(key, None)
-        if bindings is None:
-            bindings = {}
-        else:
-            del _key_binding_mapping[key]
+        bindings: dict = {}
+        if filename is not None and any(key[0] == filename for key in _key_binding_mapping):
+            # Identify the line containing the "class" keyword for cls: that
+            # is the line number that we used in the binding key for its
+            # fields.
+            class_lineno = _class_lineno_from_context(*inspect.getsourcelines(cls))
+            if class_lineno is None:
+                raise ValueError(
+                    "Could not find line containing class declaration. Are you calling inject_define properly?"
+                )
+            # get bindings to apply to the class
+            bindings = _key_binding_mapping.pop((filename, class_lineno), {})
 
         # apply attr.define to generate static methods
         cls = define(cls, **attrs_kwargs)
 
-        # apply the bindings to the class
-        init_signature = inspect.signature(cls.__init__)
-        init_signature_kwargs = list(init_signature.parameters.keys())
+        # apply the bindings to the class; iterate the (usually smaller)
+        # bindings dict once rather than probing it twice per init parameter.
+        # Only the parameter names are needed, so read them straight off the
+        # code object instead of building a full inspect.Signature (attrs
+        # generates __init__ as a plain function, but fall back to signature
+        # for anything without a code object).
+        init = cls.__init__
+        code = getattr(init, "__code__", None)
+        if code is not None:
+            init_params = frozenset(
+                code.co_varnames[1 : code.co_argcount + code.co_kwonlyargcount]
+            )
+        else:
+            init_params = frozenset(inspect.signature(init).parameters)
         kwargs = {
-            arg_name: bindings.get(arg_name)
-            for arg_name in init_signature_kwargs
-            if bindings.get(arg_name) is not None
+            arg_name: binding
+            for arg_name, binding in bindings.items()
+            if binding is not None and arg_name in init_params
         }
         inject.bind(**kwargs)(cls)
 
@@ -198,22 +221,23 @@ def _class_lineno_from_context(
 def _class_lineno_from_file(filename: str, start_lineno: int) -> Optional[int]:
     """
     Return the first line number in the named file that begins with the "class"
-    keyword.
+    keyword. Reads through linecache, which caches file contents and allows
+    jumping straight to start_lineno instead of scanning from the top (several
+    decorated classes in one module share a single read).
     """
-    with open(filename) as file:
-        first_indent = None
-        for lineno, line in enumerate(file, 1):
-            if lineno < start_lineno:
-                continue
-            stripped = line.lstrip()
-            indent = len(line) - len(stripped)
-            if first_indent is None:
-                first_indent = indent
-            elif indent < first_indent and stripped != "":
-                break  # End of declaration block; something is wrong.
-
-            if stripped.startswith("class "):
-                return lineno
-            elif '"""' in stripped or "'''" in stripped:
-                break  # Multiline string; give up on trying to parse it.
-        return None
+    lines = linecache.getlines(filename)
+    first_indent = None
+    for index in range(start_lineno - 1, len(lines)):
+        line = lines[index]
+        stripped = line.lstrip()
+        indent = len(line) - len(stripped)
+        if first_indent is None:
+            first_indent = indent
+        elif indent < first_indent and stripped != "":
+            break  # End of declaration block; something is wrong.
+
+        if stripped.startswith("class "):
+            return index + 1
+        elif '"""' in stripped or "'''" in stripped:
+            break  # Multiline string; give up on trying to parse it.
+    return None
@@ -1,7 +1,6 @@
 """Metadata defines how a class should be initialized by the Registry."""
 
-import inspect
-import itertools
+import sys
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -9,12 +8,12 @@ from typing import (
     Generic,
     Hashable,
     Optional,
-    Sequence,
+    Tuple,
     Type,
     TypeVar,
 )
 
-from .model import DeferredAny, RegistryKey, aresolve_value, resolve_value
+from .model import Deferred, DeferredAny, RegistryKey
 from .types import Kwargs
 
 if TYPE_CHECKING:
@@ -23,7 +22,9 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
 
-_INJECT_METADATA_ATTR = "_inject_meta"
+# interned so the repeated class-__dict__ probes in _get_meta/_gen_meta
+# compare the key by identity
+_INJECT_METADATA_ATTR = sys.intern("_inject_meta")
 
 
 def _get_meta(cls: Type[T], include_bases: bool = True) -> "Optional[RegistryMetadata[T]]":
@@ -42,6 +43,25 @@ def _get_meta(cls: Type[T], include_bases: bool = True) -> "Optional[RegistryMet
         return cls.__dict__.get(_INJECT_METADATA_ATTR)
 
 
+# Metadata generated for classes that carry no metadata of their own (plain
+# types, or types that only inherit metadata) is cached on the class itself,
+# under a separate attribute so it never shadows an explicit binding. Without
+# this every registry lookup by such a key allocates a fresh, equal
+# RegistryMetadata. The class->meta->class cycle this creates is collectable
+# by the gc; an entry in a module-level cache would pin the class instead
+# (even in a weak-keyed map, since the metadata references the class).
+_GENERATED_METADATA_ATTR = sys.intern("_inject_generated_meta")
+
+def _get_interfaces(cls: type) -> "Tuple[type, ...]":
+    # object is always last in the MRO of any other class, so dropping it is
+    # a single C-level slice rather than a filtering loop. The slice is cheap
+    # enough to recompute per metadata instance; a cache keyed on cls cannot
+    # help here, because the cached tuple starts with cls itself and would
+    # keep the class alive even in a weak-keyed map.
+    mro = cls.__mro__
+    return mro[:-1] if mro[-1] is object else mro
+
+
 def _get_meta_from_key(key: "RegistryKey[T]") -> "RegistryMetadata[T]":
     """
     Given a RegistryKey, return the metadata associated with the key.
@@ -60,13 +80,22 @@ def _get_meta_from_key(key: "RegistryKey[T]") -> "RegistryMetadata[T]":
         meta = _get_meta(key, include_bases=False)
         if meta is not None:
             return meta
-        else:
+        # probe __dict__ directly: generated metadata inherited from a base
+        # class describes the base, not this key
+        meta = key.__dict__.get(_GENERATED_METADATA_ATTR)
+        if meta is None:
             base = _get_meta(key, include_bases=True)
             if base is not None:
                 meta = RegistryMetadata(key, bindings=dict(base.bindings))
             else:
                 meta = RegistryMetadata(key)
-            return meta
+            try:
+                setattr(key, _GENERATED_METADATA_ATTR, meta)
+            except (AttributeError, TypeError):
+                # builtin and extension types reject new attributes; for
+                # those, regenerate the (equal) metadata on each lookup
+                pass
+        return meta
     elif isinstance(key, RegistryMetadata):
         return key
     else:
@@ -84,23 +113,43 @@ def _gen_meta(cls: Type[T]) -> "RegistryMetadata[T]":
     Returns:
         Registry metadata describing the given cls if found, otherwise a new metadata instance.
     """
-    # load metadata from the class definition
-    meta: Optional[RegistryMetadata] = getattr(cls, _INJECT_METADATA_ATTR, None)
-    if meta is None or _INJECT_METADATA_ATTR not in cls.__dict__:
-        # meta does not exist or is from parent class
-        if meta:
-            # new metadata inheriting from the parent
-            meta = RegistryMetadata(cls, bindings=dict(meta.bindings))
-        else:
-            meta = RegistryMetadata(cls)
-        # store the metadata on the class definition
-        setattr(cls, _INJECT_METADATA_ATTR, meta)
+    # the common case (class already has its own metadata, e.g. stacked
+    # decorators or repeated binding) is a single __dict__ probe that skips
+    # the MRO walk getattr would do
+    meta: Optional[RegistryMetadata] = cls.__dict__.get(_INJECT_METADATA_ATTR)
+    if meta is not None:
+        return meta
+    # meta does not exist or is from a parent class
+    inherited: Optional[RegistryMetadata] = getattr(cls, _INJECT_METADATA_ATTR, None)
+    if inherited is not None:
+        # new metadata inheriting from the parent
+        meta = RegistryMetadata(cls, bindings=dict(inherited.bindings))
+    else:
+        meta = RegistryMetadata(cls)
+    # store the metadata on the class definition
+    setattr(cls, _INJECT_METADATA_ATTR, meta)
     return meta
 
 
 class RegistryMetadata(Generic[T_co]):
     """Metadata for a registry key."""
 
+    # Metadata objects sit on the hot path of every registry lookup; slots
+    # keep them small and make attribute access a fixed-offset read.
+    __slots__ = (
+        "_cls",
+        "_bindings",
+        "_name",
+        "_start",
+        "_close",
+        "_interfaces",
+        "is_async_context",
+        "_key",
+        "_hash",
+        "_plan",
+        "_mock_spec",
+    )
+
     def __init__(
         self,
         cls: Type[T_co],
@@ -121,10 +170,22 @@ class RegistryMetadata(Generic[T_co]):
         self._name = name
         self._start = start
         self._close = close
-        self._interfaces = [cls for cls in inspect.getmro(cls) if cls is not object]
+        self._interfaces = _get_interfaces(cls)
         self.is_async_context = is_async_context
 
         self._key = key
+        # hash of the key, computed lazily alongside it (metadata instances
+        # serve as dict keys in the registry, so __hash__ is hot)
+        self._hash: Optional[int] = None
+
+        # Lazily-built split of bindings into static values and deferred
+        # values, so object initialization does not have to re-classify
+        # every binding. See _binding_plan.
+        self._plan: "Optional[Tuple[Kwargs, Tuple[Tuple[str, Deferred], ...]]]" = None
+
+        # Lazily-built (kwarg name, mock spec type) pairs used by
+        # minject.mock; derived from the bindings like _plan.
+        self._mock_spec: "Optional[Tuple[Tuple[str, type], ...]]" = None
 
     @property
     def name(self) -> Optional[str]:
@@ -140,7 +201,7 @@ class RegistryMetadata(Generic[T_co]):
         self._name = name_
 
     @property
-    def interfaces(self) -> Sequence[Type]:
+    def interfaces(self) -> Tuple[Type, ...]:
         """Get the interfaces that this object provides."""
         return self._interfaces
 
@@ -171,10 +232,11 @@ class RegistryMetadata(Generic[T_co]):
             except:
                 return id(item)
 
-        cls_and_bindings = (self._cls, self._name) + tuple(
-            (k, _hashable(v)) for k, v in self._bindings.items()
-        )
-        return cls_and_bindings
+        if not self._bindings:
+            return (self._cls, self._name)
+        # PEP 448 unpacking builds the combined tuple in one C-level pass,
+        # without the intermediate tuple a concatenation would allocate
+        return (self._cls, self._name, *((k, _hashable(v)) for k, v in self._bindings.items()))
 
     @property
     def bindings(self) -> Kwargs:
@@ -187,7 +249,34 @@ class RegistryMetadata(Generic[T_co]):
         added to the registry, it will cause undefined behavior.
         """
         # TODO: 'lock' the bindings once added to the registry to make above note unnecessary
-        self._bindings.update(bindings)
+        # interned names make the kwarg dicts built per instantiation
+        # compare keys by identity against __init__'s parameter names
+        self._bindings.update((sys.intern(name), value) for name, value in bindings.items())
+        # the cached key, its hash, the binding plan and the mock spec are
+        # all derived from the bindings, so drop them for rebuild on next
+        # access
+        self._key = None
+        self._hash = None
+        self._plan = None
+        self._mock_spec = None
+
+    def _binding_plan(self) -> "Tuple[Kwargs, Tuple[Tuple[str, Deferred], ...]]":
+        """Split bindings into static values and deferred values.
+        The static values can be passed to __init__ as-is on every
+        instantiation, only the deferred values need to be resolved against
+        the registry. The split is computed once and reused until the
+        bindings change.
+        """
+        if self._plan is None:
+            static: Kwargs = {}
+            deferred = []
+            for name_, value in self._bindings.items():
+                if isinstance(value, Deferred):
+                    deferred.append((name_, value))
+                else:
+                    static[name_] = value
+            self._plan = (static, tuple(deferred))
+        return self._plan
 
     def _new_object(self) -> T_co:
         return self._cls.__new__(self._cls)
@@ -200,9 +289,15 @@ class RegistryMetadata(Generic[T_co]):
     # TODO: Refactor these methods to belong to RegistryWrapper which has a reference to both
     # the metadata and the object throughout its creation->initialization phase
     def _init_object(self, obj: T_co, registry_impl: "Registry") -> None:  # type: ignore[misc]
-        init_kwargs = {}
-        for name_, value in self._bindings.items():
-            init_kwargs[name_] = resolve_value(registry_impl, value)
+        static, deferred = self._binding_plan()
+        if not deferred:
+            # nothing to resolve; pass the shared static kwargs straight
+            # through without building an intermediate dict
+            self._cls.__init__(obj, **static)
+            return
+        init_kwargs = dict(static)
+        for name_, value in deferred:
+            init_kwargs[name_] = value.resolve(registry_impl)
 
         self._cls.__init__(obj, **init_kwargs)
 
@@ -211,9 +306,13 @@ class RegistryMetadata(Generic[T_co]):
         asynchronous version of _init_object. Calls _aresolve instead
         of _resolve.
         """
-        init_kwargs = {}
-        for name_, value in self._bindings.items():
-            init_kwargs[name_] = await aresolve_value(registry_impl, value)
+        static, deferred = self._binding_plan()
+        if not deferred:
+            self._cls.__init__(obj, **static)
+            return
+        init_kwargs = dict(static)
+        for name_, value in deferred:
+            init_kwargs[name_] = await value.aresolve(registry_impl)
         self._cls.__init__(obj, **init_kwargs)
 
     def _start_object(self, obj: T_co) -> None:  # type: ignore[misc]
@@ -225,22 +324,26 @@ class RegistryMetadata(Generic[T_co]):
             self._close(obj)
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if isinstance(other, RegistryMetadata):
+            # cheap rejections first: the cached hashes disagree for almost
+            # every non-equal pair, sparing the full key-tuple compare
+            if hash(self) != hash(other):
+                return False
             return self.key == other.key
-        else:
-            return NotImplemented
+        return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self.key)
+        if self._hash is None:
+            self._hash = hash(self.key)
+        return self._hash
 
     def __str__(self) -> str:
-        return "{} {}({})".format(
-            repr(self._name) if self._name else "(unnamed)",
-            self._cls.__name__,
-            ", ".join(["{}={}".format(*item) for item in self._bindings.items()]),
-        )
+        name = repr(self._name) if self._name else "(unnamed)"
+        args = ", ".join(f"{key}={value}" for key, value in self._bindings.items())
+        return f"{name} {self._cls.__name__}({args})"
 
     def __repr__(self) -> str:
-        return "<RegistryMetadata {} {}({})>".format(
-            repr(self._name) if self._name else "(unnamed)", self._cls.__name__, self._bindings
-        )
+        name = repr(self._name) if self._name else "(unnamed)"
+        return f"<RegistryMetadata {name} {self._cls.__name__}({self._bindings})>"
@@ -1,8 +1,8 @@
-from typing import Optional, TypeVar
+from typing import Optional, Tuple, TypeVar
 from unittest.mock import MagicMock
 
 from .inject import _RegistryReference
-from .metadata import _get_meta_from_key
+from .metadata import RegistryMetadata, _get_meta_from_key
 from .model import MockingFunction, RegistryKey
 
 T = TypeVar("T")
@@ -11,6 +11,32 @@ T = TypeVar("T")
 DEFAULT_MOCKING_FUNCTION: MockingFunction = lambda arg: MagicMock(spec=arg)
 
 
+def _mock_spec_pairs(meta: RegistryMetadata) -> Tuple[Tuple[str, type], ...]:
+    """Derive the (kwarg name, mock spec type) pairs for a metadata instance.
+
+    Test suites often mock the same class many times; the mocks themselves
+    must be fresh per call but the binding walk that derives their specs is
+    repeatable, so the pairs are cached on the metadata itself (alongside its
+    other binding-derived caches, which update_bindings invalidates).
+    """
+    cached = meta._mock_spec
+    if cached is None:
+        pairs = []
+        for kwarg, binding in meta.bindings.items():
+            binding_type = type(binding)
+            # if the binding is a RegistryReference, we
+            # need to get the type of the referenced object
+            if binding_type is _RegistryReference:
+                binding = binding.type_of_object_referenced_in_key
+            # if the binding is not already a type, cast v to it's type
+            elif binding_type is not type:
+                binding = binding_type
+            pairs.append((kwarg, binding))
+        cached = tuple(pairs)
+        meta._mock_spec = cached
+    return cached
+
+
 def mock(key: "RegistryKey[T]", mocking_function: Optional[MockingFunction] = None) -> T:
     """
     Given a RegistryKey key, instantiate the class specified in the key
@@ -23,18 +49,9 @@ def mock(key: "RegistryKey[T]", mocking_function: Optional[MockingFunction] = No
     mocking_f = mocking_function or DEFAULT_MOCKING_FUNCTION
 
     meta_to_mock = _get_meta_from_key(key)
-    kwargs_to_mocks = {}
+    kwargs_to_mocks = {kwarg: mocking_f(spec) for kwarg, spec in _mock_spec_pairs(meta_to_mock)}
     class_instantiated_with_mocks = None
 
-    for kwarg, binding in meta_to_mock.bindings.items():
-        # if the binding is a RegistryReference, we
-        # need to get the type of the referenced object
-        if type(binding) == _RegistryReference:
-            binding = binding.type_of_object_referenced_in_key
-        # if the binding is not already a type, cast v to it's type
-        elif type(binding) != type:
-            binding = type(binding)
-        kwargs_to_mocks[kwarg] = mocking_f(binding)
     try:
         iface = meta_to_mock.interfaces[0]
         class_instantiated_with_mocks = iface(**kwargs_to_mocks)
@@ -30,6 +30,8 @@ class Resolver(abc.ABC):
     This interface primarily exists as a way to create a forward reference to Registry.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def resolve(self, key: "RegistryKey[T]") -> T: ...
 
@@ -56,11 +58,24 @@ class Resolver(abc.ABC):
 MockingFunction: TypeAlias = Callable[[Arg], Any]
 
 
+# Exact types of every Deferred subclass, maintained by __init_subclass__.
+# resolve_value/aresolve_value check membership here before falling back to
+# isinstance, because an ABC isinstance goes through ABCMeta.__instancecheck__
+# while an exact-type set probe is a single dict-style lookup.
+_deferred_types: set = set()
+
+
 class Deferred(abc.ABC, Generic[T_co]):
     """
     Deferred reference to a value which can be resolved with the help of a Registry instance.
     """
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _deferred_types.add(cls)
+
     @abc.abstractmethod
     def resolve(self, registry_impl: Resolver) -> T_co: ...
 
@@ -74,6 +89,23 @@ class Deferred(abc.ABC, Generic[T_co]):
         ...
 
 
+class _RegistrySelf(Deferred[Resolver]):
+    """Reference to the Registry instance itself."""
+
+    __slots__ = ()
+
+    def resolve(self, registry_impl: Resolver) -> Resolver:
+        return registry_impl
+
+    async def aresolve(self, registry_impl: Resolver) -> Resolver:
+        return registry_impl
+
+
+# Singleton instance; resolve_value/aresolve_value special-case it by
+# identity. (Exported to users as inject.self_tag.)
+self_tag = _RegistrySelf()
+
+
 Resolvable = Union[Deferred[T_co], T_co]
 # Union of Deferred and Any is just Any, but want to call out that a Deffered is quite common
 # and has special handling by the registry.
@@ -86,17 +118,27 @@ def resolve_value(registry_impl: Resolver, value: Resolvable[T]) -> T:
     If value is an instance of Deferred, it will be resolved using the provided
     resolver, otherwise it is already a concrete value and will be returned as is.
     """
+    # self_tag is a singleton, so an identity check covers it without the
+    # cost of an isinstance check and a resolve call
+    if value is self_tag:
+        return registry_impl  # type: ignore[return-value]
+    # exact-type probe first; isinstance only catches virtual subclasses
+    # registered via Deferred.register (none exist in minject itself)
+    if type(value) in _deferred_types:
+        return value.resolve(registry_impl)  # type: ignore[union-attr]
     if isinstance(value, Deferred):
         return value.resolve(registry_impl)
-    else:
-        return value
+    return value
 
 
 async def aresolve_value(registry_impl: Resolver, value: Resolvable[T]) -> T:
     """
     Async version of resolve_value, which calls aresolve on Deferred instances.
     """
+    if value is self_tag:
+        return registry_impl  # type: ignore[return-value]
+    if type(value) in _deferred_types:
+        return await value.aresolve(registry_impl)  # type: ignore[union-attr]
     if isinstance(value, Deferred):
         return await value.aresolve(registry_impl)
-    else:
-        return value
+    return value
@@ -6,6 +6,15 @@ from packaging import version
 
 _INJECT_DEFINE_FUNC = "inject_define"
 
+# mypy invokes the decorator hooks once per decorated class, so build the
+# callbacks a single time instead of a fresh partial per invocation
+_ATTR_CLASS_MAKER_CALLBACK = partial(
+    attrs.attr_class_maker_callback, auto_attribs_default=None, slots_default=True
+)
+_ATTR_CLASS_MAKER_CALLBACK_LEGACY = partial(
+    attrs.attr_class_maker_callback, auto_attribs_default=None
+)
+
 
 class RegistryMypyPlugin(Plugin):
     """
@@ -28,9 +37,7 @@ class RegistryMypyPlugin(Plugin):
     def get_class_decorator_hook_2(self, fullname: str):
         if _INJECT_DEFINE_FUNC in fullname:
             # slots default added in mypy version 1.5
-            return partial(
-                attrs.attr_class_maker_callback, auto_attribs_default=None, slots_default=True
-            )
+            return _ATTR_CLASS_MAKER_CALLBACK
         return None
 
 
@@ -42,22 +49,25 @@ class RegistryMypyPluginLegacy(Plugin):
 
     def get_class_decorator_hook_2(self, fullname: str):
         if _INJECT_DEFINE_FUNC in fullname:
-            return partial(attrs.attr_class_maker_callback, auto_attribs_default=None)
+            return _ATTR_CLASS_MAKER_CALLBACK_LEGACY
         return None
 
 
+# version bounds parsed once; Version skips the parse() str-dispatch wrapper
+_MIN_MYPY_VERSION = version.Version("0.6.0")
+_LEGACY_MYPY_CUTOFF = version.Version("1.5.0")
+
+
 def plugin(mypy_version: str):
-    too_old_version = version.parse(mypy_version) < version.parse("0.6.0")
+    parsed_version = version.parse(mypy_version)
 
-    if too_old_version:
+    if parsed_version < _MIN_MYPY_VERSION:
         raise ValueError(
             "mypy version must be at least 0.6.0 to use the registry plugin."
             f"You are using version {mypy_version}"
         )
 
-    use_legacy = version.parse(mypy_version) < version.parse("1.5.0")
-
-    if use_legacy:
+    if parsed_version < _LEGACY_MYPY_CUTOFF:
         return RegistryMypyPluginLegacy
 
     return RegistryMypyPlugin
@@ -91,6 +91,11 @@ class Registry(Resolver):
         self._by_meta: Dict[RegistryMetadata, _RegistryWrapper[Any]] = {}
         self._by_name: Dict[str, _RegistryWrapper[Any]] = {}
         self._by_iface: Dict[type, List[_RegistryWrapper[Any]]] = {}
+        # wrappers under construction, keyed by metadata. These are kept out
+        # of the lock-free-probed indexes above so readers never observe a
+        # partially-initialized object; circular references re-entering
+        # _register_by_metadata (under the reentrant lock) find them here.
+        self._in_progress: Dict[RegistryMetadata, _RegistryWrapper[Any]] = {}
         self._config = RegistryConfigWrapper()
 
         self._lock = RLock()
@@ -129,10 +134,9 @@ class Registry(Resolver):
             )
 
     def _autostart_candidates(self) -> Iterable[RegistryKey]:
-        registry_config: Optional[Mapping[str, Any]] = self.config.get("registry")
-        if registry_config is not None:
-            if (autostart := registry_config.get("autostart")) is not None:
-                return (_resolve_import(value) for value in autostart)
+        # the "registry" section is flattened once when config is applied
+        if (autostart := self._config._registry_section.get("autostart")) is not None:
+            return (_resolve_import(value) for value in autostart)
         return ()
 
     @_synchronized
@@ -195,14 +199,8 @@ class Registry(Resolver):
                 obj_list = self._by_iface.setdefault(iface, [])
                 obj_list.append(wrapper)
 
-    @_synchronized
-    def _set_by_metadata(
-        self, meta: RegistryMetadata[T], obj: T, _global: bool = True
-    ) -> _RegistryWrapper[T]:
-        wrapper = _RegistryWrapper(obj, meta)
-
-        if _global:
-            self._objects.append(wrapper)
+    def _index_wrapper(self, meta: RegistryMetadata[T], wrapper: _RegistryWrapper[T]) -> None:
+        """Add a wrapper to the lookup indexes. Caller must hold the lock."""
         if meta.name:
             self._by_name[meta.name] = wrapper
         else:
@@ -212,6 +210,16 @@ class Registry(Resolver):
                 obj_list = self._by_iface.setdefault(iface, [])
                 obj_list.append(wrapper)
 
+    @_synchronized
+    def _set_by_metadata(
+        self, meta: RegistryMetadata[T], obj: T, _global: bool = True
+    ) -> _RegistryWrapper[T]:
+        wrapper = _RegistryWrapper(obj, meta)
+
+        if _global:
+            self._objects.append(wrapper)
+        self._index_wrapper(meta, wrapper)
+
         return wrapper
 
     @_synchronized
@@ -232,27 +240,44 @@ class Registry(Resolver):
 
     @_synchronized
     def _register_by_metadata(self, meta: RegistryMetadata[T]) -> _RegistryWrapper[T]:
+        # double-checked locking: callers probe the indexes without the lock,
+        # so another thread may have registered this metadata while we were
+        # waiting to acquire it. Re-check before constructing.
+        name = meta.name
+        existing = self._by_name.get(name) if name else self._by_meta.get(meta)
+        if existing is not None:
+            return existing
+
+        # a circular reference during construction re-enters here on the
+        # same thread (the lock is reentrant, so it cannot be another
+        # thread); hand back the in-progress wrapper as before
+        in_progress = self._in_progress.get(meta)
+        if in_progress is not None:
+            return in_progress
+
         LOG.debug("registering %s", meta)
 
         # allocate the object (but don't initialize yet)
         obj = meta._new_object()
+        wrapper = _RegistryWrapper(obj, meta)
 
-        # add to the registry (done before init in case of circular reference)
-        wrapper = self._set_by_metadata(meta, obj, _global=False)
-
-        success = False
+        # track the construction for circular references, but keep the
+        # wrapper out of the indexes until the object is fully initialized
+        # so lock-free readers never observe a half-built object
+        self._in_progress[meta] = wrapper
         try:
             # initialize the object
             meta._init_object(obj, self)
-            # add to our list of all objects (this MUST happen after init so
-            # any references come earlier in sequence and are destroyed first)
-            self._objects.append(wrapper)
             # call start method (if any)
             wrapper.start()
-            success = True
         finally:
-            if not success:
-                self._remove_by_metadata(meta, wrapper, _global=False)
+            del self._in_progress[meta]
+
+        # publish only once fully initialized. Appending to _objects last
+        # keeps any references earlier in sequence so they are destroyed
+        # first.
+        self._index_wrapper(meta, wrapper)
+        self._objects.append(wrapper)
 
         return wrapper
 
@@ -260,35 +285,39 @@ class Registry(Resolver):
         """
         async version of _register_by_metadata. Calls _ainit_object instead of _init_object.
         """
+        # circular references re-enter here while the object is still being
+        # initialized; hand back the in-progress wrapper
+        in_progress = self._in_progress.get(meta)
+        if in_progress is not None:
+            return in_progress
+
         LOG.debug("registering %s", meta)
 
         # allocate the object (but don't initialize yet)
         obj = meta._new_object()
+        wrapper = _RegistryWrapper(obj, meta)
 
-        # add to the registry (done before init in case of circular reference)
-        wrapper = self._set_by_metadata(meta, obj, _global=False)
-
-        success = False
+        # as in _register_by_metadata: visible to circular references, but
+        # not indexed until fully initialized
+        self._in_progress[meta] = wrapper
         try:
             # initialize the object
             await meta._ainit_object(obj, self)
-            # add to our list of all objects (this MUST happen after init so
-            # any references come earlier in sequence and are destroyed first)
-            self._objects.append(wrapper)
 
             # after creating an object, enter the objects context
             # if it is marked with the @async_context decorator.
             if meta.is_async_context:
                 await self._push_async_context(obj)
-
-            success = True
         finally:
-            if not success:
-                self._remove_by_metadata(meta, wrapper, _global=False)
+            del self._in_progress[meta]
+
+        # publish only once fully initialized (see _register_by_metadata)
+        with self._lock:
+            self._index_wrapper(meta, wrapper)
+            self._objects.append(wrapper)
 
         return wrapper
 
-    @_synchronized
     def _get_by_metadata(
         self, meta: RegistryMetadata[T], default: Optional[Union[T, _AutoOrNone]] = AUTO_OR_NONE
     ) -> Optional[_RegistryWrapper[T]]:
@@ -299,12 +328,20 @@ class Registry(Resolver):
             default: return value if meta has not been registered.
                 Use AUTO_OR_NONE to create the object when missing.
         """
+        # the hit path reads the index dicts without taking the lock (dict
+        # reads are atomic under the GIL); only registration of a missing
+        # entry acquires it, and _register_by_metadata re-checks the indexes
+        # inside the critical section
         # see if a metadata name is provided
-        if meta.name:
-            if meta.name in self._by_name:
-                return self._by_name[meta.name]
-        elif meta in self._by_meta:
-            return self._by_meta[meta]
+        name = meta.name
+        if name:
+            wrapper = self._by_name.get(name)
+            if wrapper is not None:
+                return wrapper
+        else:
+            wrapper = self._by_meta.get(meta)
+            if wrapper is not None:
+                return wrapper
 
         if default is AUTO_OR_NONE:
             return self._register_by_metadata(meta)
@@ -319,13 +356,14 @@ class Registry(Resolver):
         from the signature, as there is no use case for it at the time of writing.
         Please make a feature request if you need this functionality.
         """
-        if meta in self._by_meta:
-            return self._by_meta[meta]
+        wrapper = self._by_meta.get(meta)
+        if wrapper is not None:
+            return wrapper
 
         return await self._aregister_by_metadata(meta)
 
-    @_synchronized
     def __len__(self) -> int:
+        # len() on a list is atomic; no lock needed
         return len(self._objects)
 
     def __contains__(self, key : object) -> bool:
@@ -349,7 +387,6 @@ class Registry(Resolver):
         else:
             raise KeyError(f"invalid key for Registry: {key!r}")
 
-    @_synchronized
     def get(
         self, key: "RegistryKey[T]", default: Optional[Union[T, _AutoOrNone]] = None
     ) -> Optional[T]:
@@ -408,8 +445,9 @@ class Registry(Resolver):
         meta = _get_meta_from_key(key)
 
         # if the class has already been registered, return it
-        if meta in self._by_meta:
-            return _unwrap(self._by_meta[meta])
+        wrapper = self._by_meta.get(meta)
+        if wrapper is not None:
+            return wrapper.obj
 
         # following checks only apply if key is a class
         if not isinstance(key, type):
@@ -1,3 +1,4 @@
+import threading
 import unittest
 from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -495,6 +496,41 @@ class RegistryTestCase(unittest.TestCase):
         for count in Counter(map(id, results)).values():
             self.assertEqual(count, query_per_class)
 
+    def test_concurrent_get_never_sees_partial_object(self) -> None:
+        """
+        Objects must not be visible to other threads until fully initialized:
+        a get() racing with another thread's construction should miss (and
+        block on registration) rather than return a half-built instance.
+        """
+        init_started = threading.Event()
+        release_init = threading.Event()
+
+        def slow_value() -> int:
+            init_started.set()
+            release_init.wait(timeout=5)
+            return 42
+
+        @bind(value=function(slow_value))
+        class Slow:
+            def __init__(self, value: int):
+                self.value = value
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(lambda: self.registry[Slow])
+
+            # wait until the other thread is inside Slow's initialization,
+            # then probe without constructing: the in-progress object must
+            # not be visible
+            self.assertTrue(init_started.wait(timeout=5))
+            self.assertIsNone(self.registry.get(Slow))
+
+            release_init.set()
+            constructed = future.result(timeout=5)
+
+        # once construction finishes the object is visible and complete
+        self.assertEqual(constructed.value, 42)
+        self.assertIs(self.registry[Slow], constructed)
+
     def test_bind_name_parameter(self) -> None:
         """Test that the _name parameter of inject.bind() works correctly"""
 
@@ -72,6 +72,18 @@ def test_config_envvar_missing(reg: Registry) -> None:
         _ = reg[Configable]
 
 
+def test_config_stored_none_falls_back_to_default(reg: Registry) -> None:
+    """A value stored as None is indistinguishable from a missing key (the
+    wrapper's None-means-missing convention), so the reference falls back to
+    its default or raises."""
+    reg.config.from_dict({"STORED_NONE": None})
+
+    temp: _RegistryConfig[Optional[str]] = inject.config("STORED_NONE", "fallback")
+    assert temp.resolve(reg) == "fallback"
+    with pytest.raises(KeyError):
+        inject.config("STORED_NONE").resolve(reg)
+
+
 def test_config_default_typing(reg: Registry) -> None:
     reg.config.from_dict({"EXISTS": "exists"})
     temp: _RegistryConfig[Optional[str]] = inject.config("DNE", None)